@@ -9,11 +9,11 @@ from PyQt6.QtGui import QIcon
 
 
 class MainWindow(QMainWindow):
-    def __init__(self, output_queue: queue.Queue):
+    def __init__(self, output_queue: queue.Queue, session_log=None):
         super().__init__()
         self.setWindowTitle("Guitar Tuner")
 
-        self.ui = TunerWidget(freq_input_buffer=output_queue)
+        self.ui = TunerWidget(freq_input_buffer=output_queue, session_log=session_log)
         self.setCentralWidget(self.ui)
         self.setWindowIcon(QIcon(r"Resources\pick.png"))
 
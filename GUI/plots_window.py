@@ -1,20 +1,25 @@
 import queue
 from collections import deque
 from PyQt6.QtWidgets import QMainWindow, QWidget, QVBoxLayout
-from PyQt6.QtCore import QTimer
+from PyQt6.QtCore import QTimer, QRectF
 from PyQt6.QtGui import QIcon
 import pyqtgraph as pg
 import numpy as np
 
 
 class PlotsWindow(QMainWindow):
-    def __init__(self, input_buffer: object, output_queue: queue.Queue, fs: int, window_length: int, parent=None):
+    def __init__(self, input_buffer: object, output_queue: queue.Queue, fs: int, window_length: int,
+                 spectrogram_buffer: object = None, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Signal Plots")
         self._input_buffer = input_buffer
         self._output_buffer = output_queue
         self._fs = fs
         self._window_length = window_length
+        self._spectrogram = spectrogram_buffer
+        self._spectrogram_sequence = -1
+        self._spectrogram_image = None
+        self._spectrum = None
 
         self.setWindowIcon(QIcon(r"Resources\bar.png"))
 
@@ -44,6 +49,25 @@ class PlotsWindow(QMainWindow):
         layout.addWidget(self.plot_raw)
         layout.addWidget(self.plot_fft)
         layout.addWidget(self.plot_yin)
+
+        # Scrolling spectrogram, rendered as a single image from the processor's columns
+        if self._spectrogram is not None:
+            self.plot_spec = pg.PlotWidget(title="Spectrogram")
+            self.plot_spec.setLabel('bottom', 'Time', units='s')
+            self.plot_spec.setLabel('left', 'Frequency', units='Hz')
+            self.spec_image = pg.ImageItem(axisOrder='col-major')
+            self.spec_image.setColorMap(pg.colormap.get('inferno'))
+            self.plot_spec.addItem(self.spec_image)
+            duration = len(self._spectrogram.columns) * self._spectrogram.hop_time
+            self.spec_image.setRect(QRectF(-duration, 0, duration, self._spectrogram.max_frequency))
+            self._spectrogram_image = np.empty_like(self._spectrogram.columns)
+            layout.addWidget(self.plot_spec)
+
+            # FFT panel shows the processor's newest column instead of recomputing it
+            self._spectrum = np.empty(self._spectrogram.number_of_bins, self._spectrogram.columns.dtype)
+            self.plot_fft.setTitle("FFT (magnitude, dB)")
+            self.plot_fft.setLabel('left', 'Magnitude', units='dB')
+            self.plot_fft.setYRange(self._spectrogram.floor_db, self._spectrogram.ceiling_db)
         central.setLayout(layout)
         self.setCentralWidget(central)
 
@@ -76,14 +100,23 @@ class PlotsWindow(QMainWindow):
                 frame_vis = np.clip(frame, -0.20, 0.20)
                 self.raw_curve.setData(frame_vis)
 
-                # FFT
-                win = np.hanning(len(frame)) # Hanning window
-                spectrum = np.fft.rfft(frame * win) # Compute FFT with window
-                mags = np.abs(spectrum) # Magnitudes
-                freqs = np.fft.rfftfreq(len(frame), d=1.0 / self._fs) # Frequencies
-                freq_vis = np.clip(freqs, 0, 3000) # Limit frequency axis to 3 kHz
-                mags_vis = np.clip(mags, 0, 100)
-                self.fft_curve.setData(freq_vis, mags_vis) # Plot FFT
+                # FFT, computed here only when there is no processor spectrum to reuse
+                if self._spectrogram is None:
+                    win = np.hanning(len(frame)) # Hanning window
+                    spectrum = np.fft.rfft(frame * win) # Compute FFT with window
+                    mags = np.abs(spectrum) # Magnitudes
+                    freqs = np.fft.rfftfreq(len(frame), d=1.0 / self._fs) # Frequencies
+                    freq_vis = np.clip(freqs, 0, 3000) # Limit frequency axis to 3 kHz
+                    mags_vis = np.clip(mags, 0, 100)
+                    self.fft_curve.setData(freq_vis, mags_vis) # Plot FFT
+
+        # FFT and spectrogram: only redraw when the processor pushed a new column
+        if self._spectrogram is not None and self._spectrogram.sequence != self._spectrogram_sequence:
+            self._spectrogram_sequence, image = self._spectrogram.read(out=self._spectrogram_image)
+            levels = (self._spectrogram.floor_db, self._spectrogram.ceiling_db)
+            self.spec_image.setImage(image, autoLevels=False, levels=levels)
+            _, spectrum = self._spectrogram.read_latest(out=self._spectrum)
+            self.fft_curve.setData(self._spectrogram.frequencies, spectrum)
 
         # Drain YIN output queue non-blocking
         try:
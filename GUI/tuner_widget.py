@@ -26,11 +26,12 @@ def _note_to_freq(note) -> float:
 
 
 class TunerWidget(QWidget):
-    def __init__(self, freq_input_buffer:queue.Queue = None, parent=None):
+    def __init__(self, freq_input_buffer:queue.Queue = None, session_log=None, parent=None):
         super().__init__(parent)
 
         # Audio Buffer
         self._buffer = freq_input_buffer
+        self._session_log = session_log
 
         # Rounded container styling
         self.image_label = QLabel(self)
@@ -356,6 +357,8 @@ class TunerWidget(QWidget):
     def _set_selected_note(self, note: str):
         self.note_label.setText(note)
         self.selected_frequency = _note_to_freq(note)
+        if self._session_log is not None:
+            self._session_log.set_selected_string(note, self.selected_frequency)
         self._layout_info_labels()
 
 
@@ -7,6 +7,7 @@ class Chunk:
         self.data = np.zeros(size, data_type)
         self.lock = threading.Lock()
         self.ready = False
+        self.sequence = 0  # sequence number of the data currently held
 
 
 class RollingBuffer:
@@ -14,6 +15,7 @@ class RollingBuffer:
         self.chunks = [Chunk(chunk_size, data_type) for _ in range(number_of_chunks)]
         self.write_index = 0
         self.read_index = -1
+        self.sequence = 0  # number of chunks written so far
         self.lock = threading.Lock()
 
     def write(self, data):
@@ -21,18 +23,35 @@ class RollingBuffer:
             index = self.write_index  # for readable lines
             np.copyto(self.chunks[index].data, data)
             self.chunks[index].ready = True
+            self.chunks[index].sequence = self.sequence + 1  # only this thread writes
         with self.lock:
             self.read_index = index
             self.write_index = (index + 1) % len(self.chunks)
+            self.sequence += 1
 
     def read(self) -> None | np.ndarray:
+        return self.read_latest()[1]
+
+    def read_latest(self) -> tuple[int, None | np.ndarray]:
+        """Return the latest chunk together with the sequence number it was written at."""
         with self.lock:
             index = self.read_index
+            sequence = self.sequence
         if index == -1:
-            return None
+            return sequence, None
         with self.chunks[index].lock:
             if not self.chunks[index].ready:
-                return None
+                return sequence, None
             out = self.chunks[index].data.copy()
             #self.chunks[index].ready = False
-        return out
\ No newline at end of file
+        return sequence, out
+
+    def read_sequence(self, sequence) -> None | np.ndarray:
+        """Return a copy of the chunk written at `sequence`, or None once it has been overwritten."""
+        if sequence < 1:
+            return None
+        chunk = self.chunks[(sequence - 1) % len(self.chunks)]
+        with chunk.lock:
+            if not chunk.ready or chunk.sequence != sequence:
+                return None
+            return chunk.data.copy()
@@ -1,31 +1,63 @@
-import sounddevice as sd
+import sys
+from time import monotonic
+
 import numpy as np
 from audio.buffer import RollingBuffer
 
+try:
+    import sounddevice as sd
+except (ImportError, OSError):  # No sounddevice/PortAudio, e.g. on headless CI; pass a stream_factory
+    sd = None
+
 
 class AudioCapture:
-    def __init__(self, buffer: RollingBuffer, fs, recording_time, channels):
+    def __init__(self, buffer: RollingBuffer, fs, recording_time, channels, stream_factory=None):
         self._buffer = buffer
+        if stream_factory is None:
+            if sd is None:
+                raise RuntimeError("No audio backend found (sounddevice/PortAudio unavailable); pass a stream_factory")
+            stream_factory = sd.InputStream
+        self._stream_factory = stream_factory
         self._sample_rate = fs
         self._window_time = recording_time
         self._channels = channels
         self._enable = False
         self._stream = None
+        self._overflows = 0
+        self._status_printed_at = None
+        self._statuses_suppressed = 0
 
     @property
     def enable(self):
         return self._enable
 
+    @property
+    def overflows(self):
+        return self._overflows
+
 
     def audio_callback(self, indata : np.ndarray, frames: int, time, status) -> None :
         if status:
-           print(status)
+            if status.input_overflow:
+                self._overflows += 1
+            self._print_status(status)
         self._buffer.write(indata.squeeze())
 
+    def _print_status(self, status) -> None:
+        # Overflows can come in bursts, so print at most once per second and report what was held back
+        now = monotonic()
+        if self._status_printed_at is not None and now - self._status_printed_at < 1.0:
+            self._statuses_suppressed += 1
+            return
+        suffix = f" (+{self._statuses_suppressed} suppressed)" if self._statuses_suppressed else ""
+        print(f"{status}{suffix}", file=sys.stderr)
+        self._status_printed_at = now
+        self._statuses_suppressed = 0
+
     def start_recording(self):
         if not self._enable:
             self._enable = True
-            self._stream = sd.InputStream(
+            self._stream = self._stream_factory(
                 samplerate= self._sample_rate,
                 channels= self._channels,
                 blocksize= self._window_time,
@@ -4,30 +4,89 @@ import queue
 
 import numpy as np
 from librosa import yin
-from audio import buffer
+from audio import buffer, spectrogram, session_log
+
+F0_MIN = 50  # Hz, lowest pitch YIN searches for; also bounds the confidence lag window
+F0_MAX = 500  # Hz, highest pitch YIN searches for
+
+
+def _yin_confidence(data, fundamental, fs, fmin=F0_MIN):
+    """One minus the cumulative mean normalized YIN difference at the estimated period, clipped to 0..1."""
+    max_lag = int(fs / fmin) + 2
+    width = len(data) - max_lag
+    if width <= 0 or not np.isfinite(fundamental) or fundamental <= 0:
+        return 0.0
+    x = data.astype(np.float64)
+    n = 1 << int(np.ceil(np.log2(len(x) + width)))
+    # r[tau] = sum_j x[j] * x[j + tau] over the first `width` samples
+    r = np.fft.irfft(np.conj(np.fft.rfft(x[:width], n)) * np.fft.rfft(x, n), n)[:max_lag]
+    energy = np.concatenate(([0.0], np.cumsum(x ** 2)))
+    shifted_energy = energy[width:width + max_lag] - energy[:max_lag]
+    difference = energy[width] + shifted_energy - 2.0 * r
+    difference[0] = 0.0
+    lags = np.arange(1, max_lag)
+    normalized = difference[1:] * lags / np.maximum(np.cumsum(difference[1:]), 1e-12)
+    period = int(round(fs / fundamental))
+    if not 2 <= period < max_lag - 1:
+        return 0.0
+    aperiodicity = normalized[period - 2:period + 1].min()  # period +-1 lag, normalized starts at lag 1
+    return float(np.clip(1.0 - aperiodicity, 0.0, 1.0))
 
 
 class Processor:
-    def __init__(self, input_buffer: buffer.RollingBuffer, output_buffer: queue.Queue, fs, window_length):
+    def __init__(self, input_buffer: buffer.RollingBuffer, output_buffer: queue.Queue, fs, window_length,
+                 spectrogram_buffer: spectrogram.Spectrogram = None, log: session_log.SessionLog = None):
         self._rolling_buffer = input_buffer
         self._output = output_buffer
         self._fs = fs
         self._window_length = window_length
+        self._spectrogram = spectrogram_buffer
+        self._log = log
+        self._window = np.hanning(window_length).astype(np.float32)
+        self._last_sequence = 0
         self._enable = False
         self._thread = None
 
+    def _spectrum(self, data):
+        return np.abs(np.fft.rfft(data * self._window))
+
+    def _update_spectrogram(self, previous_sequence, sequence, data):
+        # Chunks written since the last pass that are still in the ring get real columns
+        first = max(previous_sequence + 1, sequence - len(self._spectrogram.columns))
+        self._spectrogram.push_missing(first - previous_sequence - 1)
+        for missed in range(first, sequence):
+            missed_data = self._rolling_buffer.read_sequence(missed)
+            if missed_data is None: # Overwritten before we got to it
+                self._spectrogram.push_missing()
+            else:
+                self._spectrogram.push(self._spectrum(missed_data))
+        self._spectrogram.push(self._spectrum(data))
+
     def _process_loop(self):
         while self._enable: # Main processing loop
-            data = self._rolling_buffer.read() # Read audio data from the rolling buffer
+            sequence, data = self._rolling_buffer.read_latest() # Read audio data from the rolling buffer
+            if sequence == self._last_sequence: # Each hop is processed only once
+                time.sleep(0.01)
+                continue
+            previous_sequence = self._last_sequence
+            self._last_sequence = sequence
             if data is not None: # If data is available
+                if self._spectrogram is not None: # Append one STFT column per hop, even for quiet frames
+                    self._update_spectrogram(previous_sequence, sequence, data)
+
                 rms = np.sqrt(np.mean(data ** 2)) # Calculate RMS to check signal strength
                 threshold = 0.0075 # Threshold to ignore low-amplitude signals
                 if rms < threshold:# If signal is too weak, skip processing
+                    if self._log is not None:
+                        self._log.append(np.nan, 0.0, rms)
                     time.sleep(0.01) # Sleep briefly to avoid busy-waiting
                     continue # Continue to the next iteration
 
-                f0 = yin(data, fmin=50, fmax=500, sr=self._fs, frame_length=len(data)) # Apply YIN algorithm to estimate fundamental frequency
+                f0 = yin(data, fmin=F0_MIN, fmax=F0_MAX, sr=self._fs, frame_length=len(data)) # Apply YIN algorithm to estimate fundamental frequency
                 fundamental = np.median(f0) # Take the median of the estimated frequencies
+                if self._log is not None: # Confidence recomputes a difference function, so only when logging
+                    confidence = _yin_confidence(data, fundamental, self._fs)
+                    self._log.append(fundamental, confidence, rms)
                 try:
                     self._output.put_nowait(fundamental) # Output the estimated frequency to the output queue
                 except queue.Full: # If the output queue is full, skip this value
@@ -0,0 +1,118 @@
+import os
+import queue
+import threading
+import time
+
+import numpy as np
+
+STRINGS = ("E2", "A", "D", "G", "B", "E4")
+NO_STRING = 255
+
+MAGIC = b"PYTUNERLOG"
+VERSION = 1
+HEADER_SIZE = 16
+
+RECORD_DTYPE = np.dtype([
+    ("timestamp", "<f8"),   # seconds since the epoch
+    ("f0", "<f4"),          # Hz, NaN when the frame was too quiet
+    ("confidence", "<f4"),  # 0..1, one minus the YIN aperiodicity at the estimated period
+    ("rms", "<f4"),
+    ("string", "u1"),       # index into STRINGS, NO_STRING if none selected
+    ("offset", "<f4"),      # percent from the selected string frequency
+])
+
+
+def _header() -> bytes:
+    header = MAGIC + np.array([VERSION, RECORD_DTYPE.itemsize], "<u2").tobytes()
+    return header.ljust(HEADER_SIZE, b"\0")
+
+
+class SessionLog:
+    """Append-only binary log of pitch telemetry, written by a background thread."""
+
+    def __init__(self, path, queue_size=1024, flush_interval=1.0):
+        self._path = path
+        self._records = queue.Queue(maxsize=queue_size)
+        self._flush_interval = flush_interval
+        self._selection = (NO_STRING, None)  # (string index, frequency), replaced as one tuple
+        self._dropped = 0
+        self._enable = False
+        self._thread = None
+        self._file = None
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def dropped(self):
+        return self._dropped
+
+    def set_selected_string(self, name: str, frequency: float | None) -> None:
+        index = STRINGS.index(name) if name in STRINGS else NO_STRING
+        self._selection = (index, frequency or None)  # one assignment, so append never mixes strings
+
+    def append(self, f0: float, confidence: float, rms: float) -> None:
+        """Queue one record; never blocks, drops the record if the writer falls behind."""
+        string, frequency = self._selection
+        offset = np.nan if frequency is None else (f0 - frequency) / (frequency * 0.01)
+        try:
+            self._records.put_nowait((time.time(), f0, confidence, rms, string, offset))
+        except queue.Full:
+            self._dropped += 1
+
+    def _write_loop(self):
+        last_flush = time.monotonic()
+        while self._enable or not self._records.empty():
+            try:
+                batch = [self._records.get(timeout=0.1)]
+            except queue.Empty:
+                continue
+            try:
+                while True:
+                    batch.append(self._records.get_nowait())
+            except queue.Empty:
+                pass
+            self._file.write(np.array(batch, dtype=RECORD_DTYPE).tobytes())
+            if time.monotonic() - last_flush >= self._flush_interval:
+                self._file.flush()
+                last_flush = time.monotonic()
+
+    def start_logging(self):
+        if not self._enable:
+            directory = os.path.dirname(self._path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(self._path, "ab")
+            if self._file.tell() == 0:
+                self._file.write(_header())
+            self._enable = True
+            self._thread = threading.Thread(target=self._write_loop, daemon=False)
+            self._thread.start()
+
+    def stop_logging(self):
+        self._enable = False
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def read_session_log(path) -> np.ndarray:
+    """Memory-map a session log; fields are available as arrays, e.g. log["f0"]."""
+    with open(path, "rb") as f:
+        header = f.read(HEADER_SIZE)
+    if len(header) < HEADER_SIZE or not header.startswith(MAGIC):
+        raise ValueError(f"{path} is not a session log")
+    version, record_size = np.frombuffer(header, "<u2", count=2, offset=len(MAGIC))
+    if version != VERSION:
+        raise ValueError(f"{path} has unsupported log version {version}, expected {VERSION}")
+    if record_size != RECORD_DTYPE.itemsize:
+        raise ValueError(f"{path} has {record_size}-byte records, expected {RECORD_DTYPE.itemsize}")
+    # Ignore a trailing partial record left by a log that is still being written
+    count = (os.path.getsize(path) - HEADER_SIZE) // RECORD_DTYPE.itemsize
+    if count == 0:
+        return np.zeros(0, RECORD_DTYPE)
+    return np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=HEADER_SIZE, shape=(count,))
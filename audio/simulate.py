@@ -0,0 +1,132 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+
+class SimulatedStatus:
+    """Stand-in for sounddevice.CallbackFlags with the flags the simulator can raise."""
+
+    def __init__(self, input_overflow=False):
+        self.input_overflow = input_overflow
+
+    def __bool__(self):
+        return self.input_overflow
+
+    def __str__(self):
+        return "input overflow" if self.input_overflow else ""
+
+
+def sine_source(frequencies, fs, amplitude=0.1, noise=0.0, seed=None):
+    """Endless source of summed sines (plus optional white noise), returned as a block generator function."""
+    frequencies = np.atleast_1d(np.asarray(frequencies, np.float64))
+    rng = np.random.default_rng(seed)
+    position = 0
+
+    def next_block(frames):
+        nonlocal position
+        t = (position + np.arange(frames)) / fs
+        block = amplitude * np.sin(2 * np.pi * np.outer(t, frequencies)).sum(axis=1) / len(frequencies)
+        if noise:
+            block += rng.normal(0.0, noise, frames)
+        position += frames
+        return block.astype(np.float32)
+    return next_block
+
+
+def array_source(samples, loop=True):
+    """Block generator function over a 1-D array; pads with silence once exhausted unless looping."""
+    samples = np.asarray(samples, np.float32)
+    position = 0
+
+    def next_block(frames):
+        nonlocal position
+        if loop:
+            index = (position + np.arange(frames)) % len(samples)
+            block = samples[index]
+        else:
+            block = np.zeros(frames, np.float32)
+            chunk = samples[position:position + frames]
+            block[:len(chunk)] = chunk
+        position += frames
+        return block
+    return next_block
+
+
+def file_source(path, fs, loop=True):
+    """Block generator function over an audio file, resampled to fs and mixed down to mono."""
+    from librosa import load
+    samples, _ = load(path, sr=fs, mono=True)
+    return array_source(samples, loop)
+
+
+class SimulatedInputStream:
+    """Drop-in replacement for sounddevice.InputStream that feeds the callback from a block source.
+
+    speed scales the block rate relative to real time (None runs as fast as possible), jitter is the
+    standard deviation in seconds added to each block's delivery time, and overflow_rate is the
+    probability that a block is lost, which flags input_overflow on the next callback. Pass rng
+    (anything with random() and normal()) to script those draws; otherwise one is seeded from seed.
+    """
+
+    def __init__(self, samplerate, channels, blocksize, callback, source=None, speed=1.0,
+                 jitter=0.0, overflow_rate=0.0, seed=None, rng=None, **kwargs):
+        self.samplerate = samplerate
+        self.channels = channels
+        self.blocksize = blocksize
+        self._callback = callback
+        self._source = source if source is not None else sine_source(110.0, samplerate)
+        self._speed = speed
+        self._jitter = jitter
+        self._overflow_rate = overflow_rate
+        self._rng = rng if rng is not None else np.random.default_rng(seed)
+        self._indata = np.zeros((blocksize, channels), np.float32)
+        self._enable = False
+        self._thread = None
+        self.delivered = 0
+        self.overflows = 0
+
+    @property
+    def active(self):
+        return self._enable
+
+    def _stream_loop(self):
+        period = None if not self._speed else self.blocksize / (self.samplerate * self._speed)
+        start = time.perf_counter()
+        overflow = False
+        block_index = 0
+        while self._enable:
+            block = self._source(self.blocksize)
+            block_index += 1
+            if period is not None:
+                delay = start + block_index * period - time.perf_counter()
+                if self._jitter:
+                    delay += abs(self._rng.normal(0.0, self._jitter))
+                if delay > 0:
+                    time.sleep(delay)
+            if self._overflow_rate and self._rng.random() < self._overflow_rate:
+                overflow = True  # block lost before reaching the callback
+                self.overflows += 1
+                continue
+            self._indata[:] = block[:, np.newaxis]
+            now = time.perf_counter()
+            stream_time = SimpleNamespace(inputBufferAdcTime=now, currentTime=now)
+            self._callback(self._indata, self.blocksize, stream_time, SimulatedStatus(overflow))
+            overflow = False
+            self.delivered += 1
+
+    def start(self):
+        if not self._enable:
+            self._enable = True
+            self._thread = threading.Thread(target=self._stream_loop, daemon=False)
+            self._thread.start()
+
+    def stop(self):
+        self._enable = False
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def close(self):
+        self.stop()
@@ -0,0 +1,65 @@
+import threading
+import numpy as np
+
+
+class Spectrogram:
+    """Fixed-size circular 2-D array of spectrum columns, one column per captured chunk.
+
+    A hop is one RollingBuffer chunk of window_length samples. Chunks that were overwritten
+    before the processor reached them are stored as floor columns (see push_missing), so the
+    time axis stays in step with the capture stream.
+    """
+
+    def __init__(self, number_of_columns, fs, window_length, max_frequency=3000,
+                 floor_db=-60.0, ceiling_db=60.0, data_type=np.float32):
+        self.fs = fs
+        self.window_length = window_length
+        self.number_of_bins = min(window_length // 2 + 1, int(max_frequency * window_length / fs) + 1)
+        self.max_frequency = (self.number_of_bins - 1) * fs / window_length
+        self.frequencies = np.arange(self.number_of_bins) * fs / window_length
+        self.hop_time = window_length / fs
+        self.floor_db = floor_db
+        self.ceiling_db = ceiling_db  # a Hann-windowed full-scale tone over 8192 samples peaks near 66 dB
+        self.columns = np.full((number_of_columns, self.number_of_bins), floor_db, data_type)
+        self.write_index = 0
+        self.sequence = 0  # number of columns pushed so far
+        self.lock = threading.Lock()
+
+    def push(self, magnitudes: np.ndarray) -> None:
+        """Store one rfft magnitude column (in dB), overwriting the oldest one."""
+        column = magnitudes[:self.number_of_bins]
+        with self.lock:
+            index = self.write_index  # for readable lines
+            np.log10(column + 1e-12, out=self.columns[index])
+            self.columns[index] *= 20.0
+            np.maximum(self.columns[index], self.floor_db, out=self.columns[index])
+            self.write_index = (index + 1) % len(self.columns)
+            self.sequence += 1
+
+    def push_missing(self, count: int = 1) -> None:
+        """Store `count` floor columns for hops whose audio was overwritten before it was analysed."""
+        with self.lock:
+            for _ in range(min(count, len(self.columns))):
+                self.columns[self.write_index] = self.floor_db
+                self.write_index = (self.write_index + 1) % len(self.columns)
+            self.sequence += count
+
+    def read(self, out: np.ndarray | None = None) -> tuple[int, np.ndarray]:
+        """Return the sequence number and the columns ordered oldest to newest."""
+        if out is None:
+            out = np.empty_like(self.columns)
+        with self.lock:
+            split = len(self.columns) - self.write_index
+            out[:split] = self.columns[self.write_index:]
+            out[split:] = self.columns[:self.write_index]
+            sequence = self.sequence
+        return sequence, out
+
+    def read_latest(self, out: np.ndarray | None = None) -> tuple[int, np.ndarray]:
+        """Return the sequence number and the newest column (in dB)."""
+        if out is None:
+            out = np.empty(self.number_of_bins, self.columns.dtype)
+        with self.lock:
+            out[:] = self.columns[self.write_index - 1]
+            sequence = self.sequence
+        return sequence, out
@@ -0,0 +1 @@
+# Root conftest: lets plain `pytest` import the top-level `audio` and `GUI` packages.
@@ -1,4 +1,6 @@
+import os
 import sys
+import time
 import queue
 import sounddevice
 
@@ -6,11 +8,15 @@ from PyQt6.QtWidgets import QApplication
 from GUI.main_window import MainWindow
 from GUI.plots_window import PlotsWindow
 
-from audio import buffer, capture, process
+from audio import buffer, capture, process, spectrogram, session_log
 
 AUDIO_CHANNELS = 1  # Mono channel
 SAMPLERATE = 44100  # 44.1k Hz
 WINDOW_LENGTH = 8192  # Window length by Sample Count
+SPECTROGRAM_COLUMNS = 256  # Spectrogram history in hops (~47 s at 44.1k Hz)
+# Binary pitch telemetry, read back with session_log.read_session_log; set PYTUNER_SESSION_LOG_DIR to
+# choose the directory, or to an empty string to turn logging off
+SESSION_LOG_DIR = os.environ.get("PYTUNER_SESSION_LOG_DIR", "sessions")
 
 
 def main():
@@ -20,21 +26,32 @@ def main():
 
     circular_buffer = buffer.RollingBuffer(5, chunk_size=AUDIO_CHANNELS * WINDOW_LENGTH)
     recorder = capture.AudioCapture(circular_buffer, SAMPLERATE, WINDOW_LENGTH, AUDIO_CHANNELS)
-    recorder.start_recording()
 
     output_buffer = queue.Queue(maxsize=5)
-    processor = process.Processor(circular_buffer, output_buffer, SAMPLERATE, WINDOW_LENGTH)
-    processor.start_processing()
-
-    app = QApplication(sys.argv)
-    window = MainWindow(output_buffer)
-    plots_win = PlotsWindow(circular_buffer, output_buffer, SAMPLERATE, WINDOW_LENGTH)
-    window.show()
-    plots_win.show()
-    code = app.exec()
-
-    processor.stop_processing()
-    recorder.stop_recording()
+    spectrogram_buffer = spectrogram.Spectrogram(SPECTROGRAM_COLUMNS, SAMPLERATE, WINDOW_LENGTH)
+    log = None
+    if SESSION_LOG_DIR:
+        log = session_log.SessionLog(os.path.join(SESSION_LOG_DIR, time.strftime("%Y%m%d-%H%M%S.ptlog")))
+    processor = process.Processor(circular_buffer, output_buffer, SAMPLERATE, WINDOW_LENGTH, spectrogram_buffer, log)
+
+    # Worker threads are non-daemon, so stop them even if the GUI fails to come up
+    try:
+        recorder.start_recording()
+        if log is not None:
+            log.start_logging()
+        processor.start_processing()
+
+        app = QApplication(sys.argv)
+        window = MainWindow(output_buffer, log)
+        plots_win = PlotsWindow(circular_buffer, output_buffer, SAMPLERATE, WINDOW_LENGTH, spectrogram_buffer)
+        window.show()
+        plots_win.show()
+        code = app.exec()
+    finally:
+        processor.stop_processing()
+        recorder.stop_recording()
+        if log is not None:
+            log.stop_logging()
     sys.exit(code)
 
 
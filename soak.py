@@ -0,0 +1,197 @@
+"""Headless soak test: simulated stream -> RollingBuffer -> Processor -> queue.
+
+Example: python soak.py --duration 600 --speed 4 --jitter 0.005 --overflow-rate 0.01
+
+Exits non-zero when a pass/fail threshold is broken, so it can gate CI.
+"""
+import argparse
+import os
+import queue
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+from audio import buffer, capture, process, session_log, simulate, spectrogram
+
+AUDIO_CHANNELS = 1  # Mono channel
+SAMPLERATE = 44100  # 44.1k Hz
+WINDOW_LENGTH = 8192  # Window length by Sample Count
+SPECTROGRAM_COLUMNS = 256  # Same history as main.py
+
+
+class _TimedBuffer(buffer.RollingBuffer):
+    """RollingBuffer that remembers when each chunk was written and which chunks were read."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.write_times = {}  # sequence -> write time, pruned as chunks are read or skipped
+        self.last_read = 0
+        self.last_read_time = None
+        self.processed = 0
+
+    def write(self, data):
+        # Stamp before publishing so the reader never sees a chunk without its time
+        self.write_times[self.sequence + 1] = time.perf_counter()
+        super().write(data)
+
+    def read_latest(self):
+        sequence, data = super().read_latest()
+        if data is not None and sequence != self.last_read:
+            # Take the write time now; the writer may lap the chunk ring while YIN runs
+            for skipped in range(self.last_read + 1, sequence):
+                self.write_times.pop(skipped, None)
+            self.last_read_time = self.write_times.pop(sequence, None)
+            self.last_read = sequence
+            self.processed += 1
+        return sequence, data
+
+
+class _TimedQueue(queue.Queue):
+    """Output queue that measures chunk-written to pitch-available latency."""
+
+    def __init__(self, source: _TimedBuffer, maxsize=0):
+        super().__init__(maxsize)
+        self._source = source
+        self.latencies = []
+        self.full = 0
+
+    def put_nowait(self, item):
+        written = self._source.last_read_time
+        try:
+            super().put_nowait(item)
+        except queue.Full:
+            self.full += 1
+            raise
+        if written is not None:
+            self.latencies.append(time.perf_counter() - written)
+
+
+def run(duration, speed, jitter, overflow_rate, frequency, path=None, seed=None,
+        with_spectrogram=True, with_log=True):
+    circular_buffer = _TimedBuffer(5, chunk_size=AUDIO_CHANNELS * WINDOW_LENGTH)
+    output_buffer = _TimedQueue(circular_buffer, maxsize=5)
+
+    if path:
+        source = simulate.file_source(path, SAMPLERATE)
+    else:
+        source = simulate.sine_source(frequency, SAMPLERATE, noise=0.005, seed=seed)
+    streams = []
+
+    def stream_factory(**kwargs):
+        stream = simulate.SimulatedInputStream(source=source, speed=speed, jitter=jitter,
+                                               overflow_rate=overflow_rate, seed=seed, **kwargs)
+        streams.append(stream)
+        return stream
+
+    recorder = capture.AudioCapture(circular_buffer, SAMPLERATE, WINDOW_LENGTH, AUDIO_CHANNELS, stream_factory)
+    # Build the processor like main.py does, so the per-hop spectrum, confidence and log work is measured
+    spectrogram_buffer = spectrogram.Spectrogram(SPECTROGRAM_COLUMNS, SAMPLERATE, WINDOW_LENGTH) if with_spectrogram else None
+    log_dir = tempfile.TemporaryDirectory() if with_log else None
+    log = session_log.SessionLog(os.path.join(log_dir.name, "soak.ptlog")) if with_log else None
+    processor = process.Processor(circular_buffer, output_buffer, SAMPLERATE, WINDOW_LENGTH, spectrogram_buffer, log)
+
+    estimates = []
+    stop = threading.Event()
+
+    def consume():  # stands in for the GUI draining the queue
+        while not stop.is_set():
+            try:
+                estimates.append(output_buffer.get(timeout=0.1))
+            except queue.Empty:
+                pass
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    if log is not None:
+        log.start_logging()
+    start = time.perf_counter()
+    try:
+        processor.start_processing()
+        recorder.start_recording()
+        time.sleep(duration)
+    finally:
+        recorder.stop_recording()
+        elapsed = time.perf_counter() - start
+        processor.stop_processing()
+        stop.set()
+        consumer.join()
+        if log is not None:
+            log.stop_logging()
+            logged = len(session_log.read_session_log(log.path))
+            log_dir.cleanup()
+
+    stream = streams[0]
+    latencies = np.array(output_buffer.latencies) * 1000.0
+    estimates = np.array(estimates)
+    audio_seconds = stream.delivered * WINDOW_LENGTH / SAMPLERATE
+    return {
+        "wall time (s)": elapsed,
+        "audio processed (s)": circular_buffer.processed * WINDOW_LENGTH / SAMPLERATE,
+        "realtime factor": audio_seconds / elapsed,
+        "chunks delivered": stream.delivered,
+        "chunks processed": circular_buffer.processed,
+        "overwritten ratio": (stream.delivered - circular_buffer.processed) / max(1, stream.delivered),
+        "dropped: overflow": stream.overflows,
+        "overflow flags seen by callback": recorder.overflows,
+        "dropped: overwritten before processing": stream.delivered - circular_buffer.processed,
+        "dropped: output queue full": output_buffer.full,
+        "dropped: session log full": log.dropped if log is not None else 0,
+        "records logged": logged if log is not None else 0,
+        "pitch estimates": len(estimates),
+        "median f0 (Hz)": float(np.median(estimates)) if len(estimates) else float("nan"),
+        "latency p50 (ms)": float(np.percentile(latencies, 50)) if len(latencies) else float("nan"),
+        "latency p95 (ms)": float(np.percentile(latencies, 95)) if len(latencies) else float("nan"),
+        "latency p99 (ms)": float(np.percentile(latencies, 99)) if len(latencies) else float("nan"),
+        "latency max (ms)": float(latencies.max()) if len(latencies) else float("nan"),
+    }
+
+
+def check(report, args) -> list[str]:
+    """Return the pass/fail thresholds the report breaks; NaN values count as failures."""
+    failures = []
+    if not report["overwritten ratio"] <= args.max_overwritten_ratio:
+        failures.append(f"overwritten ratio {report['overwritten ratio']:.3f} > {args.max_overwritten_ratio}")
+    if not report["latency p99 (ms)"] <= args.max_p99_latency_ms:
+        failures.append(f"p99 latency {report['latency p99 (ms)']:.1f} ms > {args.max_p99_latency_ms} ms")
+    if not args.file:
+        error = abs(report["median f0 (Hz)"] - args.frequency) / args.frequency
+        if not error <= args.f0_tolerance:
+            failures.append(f"median f0 {report['median f0 (Hz)']:.2f} Hz is off by {error:.2%} from {args.frequency} Hz")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--duration", type=float, default=60.0, help="wall-clock seconds to run")
+    parser.add_argument("--speed", type=float, default=1.0, help="multiple of real time, 0 for unthrottled")
+    parser.add_argument("--jitter", type=float, default=0.0, help="delivery jitter std-dev in seconds")
+    parser.add_argument("--overflow-rate", type=float, default=0.0, help="probability a block is lost")
+    parser.add_argument("--frequency", type=float, default=110.0, help="sine frequency in Hz")
+    parser.add_argument("--file", help="audio file to loop instead of a sine")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--no-spectrogram", action="store_true", help="skip the per-hop spectrogram column")
+    parser.add_argument("--no-log", action="store_true", help="skip the session log (confidence and writer)")
+    parser.add_argument("--max-overwritten-ratio", type=float, default=0.05,
+                        help="fail if more than this share of chunks is overwritten before processing")
+    parser.add_argument("--max-p99-latency-ms", type=float, default=500.0, help="fail above this p99 latency")
+    parser.add_argument("--f0-tolerance", type=float, default=0.01,
+                        help="fail if the median f0 is further than this ratio from --frequency (sine only)")
+    args = parser.parse_args()
+
+    report = run(args.duration, args.speed, args.jitter, args.overflow_rate, args.frequency, args.file, args.seed,
+                 with_spectrogram=not args.no_spectrogram, with_log=not args.no_log)
+    width = max(len(name) for name in report)
+    for name, value in report.items():
+        print(f"{name:<{width}}  {value:.3f}" if isinstance(value, float) else f"{name:<{width}}  {value}")
+
+    failures = check(report, args)
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+import numpy as np
+
+from audio import process
+
+FS = 44100
+
+
+def test_confidence_is_high_for_a_clean_tone():
+    t = np.arange(8192) / FS
+    tone = (0.1 * np.sin(2 * np.pi * 110.0 * t)).astype(np.float32)
+    assert process._yin_confidence(tone, 110.0, FS) > 0.99
+
+
+def test_confidence_is_low_for_noise():
+    noise = np.random.default_rng(0).normal(0.0, 0.1, 8192).astype(np.float32)
+    assert process._yin_confidence(noise, 110.0, FS) < 0.2
+
+
+def test_confidence_drops_for_the_wrong_period():
+    t = np.arange(8192) / FS
+    tone = (0.1 * np.sin(2 * np.pi * 110.0 * t)).astype(np.float32)
+    assert process._yin_confidence(tone, 150.0, FS) < 0.5
+
+
+def test_confidence_is_zero_without_a_pitch():
+    tone = np.zeros(8192, np.float32)
+    assert process._yin_confidence(tone, np.nan, FS) == 0.0
+    assert process._yin_confidence(tone, process.F0_MIN / 2, FS) == 0.0
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from audio import session_log
+
+
+def _write(path, records):
+    log = session_log.SessionLog(str(path))
+    log.start_logging()
+    log.set_selected_string("A", 110.0)
+    for f0, confidence, rms in records:
+        log.append(f0, confidence, rms)
+    log.stop_logging()
+    return log
+
+
+def test_header_and_packed_record_size(tmp_path):
+    path = tmp_path / "session.ptlog"
+    _write(path, [(110.0, 1.0, 0.1)])
+    raw = path.read_bytes()
+    assert session_log.RECORD_DTYPE.itemsize == 25
+    assert raw[:session_log.HEADER_SIZE] == b"PYTUNERLOG\x01\x00\x19\x00\x00\x00"
+    assert len(raw) == session_log.HEADER_SIZE + 25
+
+
+def test_round_trip_and_offset(tmp_path):
+    path = tmp_path / "nested" / "session.ptlog"
+    _write(path, [(111.1, 0.9, 0.02), (np.nan, 0.0, 0.001)])
+    log = session_log.read_session_log(path)
+    assert len(log) == 2
+    assert log["string"][0] == session_log.STRINGS.index("A")
+    np.testing.assert_allclose(log["f0"][0], 111.1, rtol=1e-6)
+    np.testing.assert_allclose(log["offset"][0], 1.0, rtol=1e-4)
+    assert np.isnan(log["f0"][1]) and np.isnan(log["offset"][1])
+
+
+def test_reopen_appends_without_second_header(tmp_path):
+    path = tmp_path / "session.ptlog"
+    _write(path, [(110.0, 1.0, 0.1)])
+    _write(path, [(220.0, 1.0, 0.1), (330.0, 1.0, 0.1)])
+    log = session_log.read_session_log(path)
+    np.testing.assert_allclose(log["f0"], [110.0, 220.0, 330.0])
+
+
+def test_trailing_partial_record_is_ignored(tmp_path):
+    path = tmp_path / "session.ptlog"
+    _write(path, [(110.0, 1.0, 0.1)])
+    with open(path, "ab") as f:
+        f.write(b"\0" * 7)
+    assert len(session_log.read_session_log(path)) == 1
+
+
+def test_empty_log_reads_as_no_records(tmp_path):
+    path = tmp_path / "session.ptlog"
+    _write(path, [])
+    assert len(session_log.read_session_log(path)) == 0
+
+
+@pytest.mark.parametrize("header, message", [
+    (b"NOTALOG\0" * 2, "is not a session log"),
+    (b"PYTUNERLOG\x02\x00\x19\x00\x00\x00", "unsupported log version 2"),
+    (b"PYTUNERLOG\x01\x00\x18\x00\x00\x00", "24-byte records"),
+])
+def test_bad_headers_are_reported(tmp_path, header, message):
+    path = tmp_path / "session.ptlog"
+    path.write_bytes(header)
+    with pytest.raises(ValueError, match=message):
+        session_log.read_session_log(path)
@@ -0,0 +1,67 @@
+import threading
+import time
+
+import numpy as np
+
+from audio import simulate
+
+
+class _ScriptedRng:
+    """Replays fixed random() draws so overflow injection is deterministic."""
+
+    def __init__(self, draws):
+        self._draws = iter(draws)
+
+    def random(self):
+        return next(self._draws, 1.0)
+
+    def normal(self, loc=0.0, scale=1.0):
+        return loc
+
+
+def _run(stream, seconds):
+    stream.start()
+    time.sleep(seconds)
+    stream.stop()
+
+
+def test_block_rate_scales_with_speed():
+    fs, blocksize = 1000, 50  # 20 blocks per second at real time
+    counts = {}
+    for speed in (1.0, 4.0):
+        stream = simulate.SimulatedInputStream(fs, 1, blocksize, lambda *args: None, speed=speed)
+        _run(stream, 0.5)
+        counts[speed] = stream.delivered
+    assert 7 <= counts[1.0] <= 12
+    assert 35 <= counts[4.0] <= 42
+
+
+def test_overflow_is_flagged_on_next_callback():
+    statuses = []
+    done = threading.Event()
+
+    def callback(indata, frames, time_info, status):
+        statuses.append(bool(status))
+        if len(statuses) == 3:
+            done.set()
+
+    # Block 1 delivered, block 2 lost, blocks 3 and 4 delivered
+    stream = simulate.SimulatedInputStream(1000, 1, 50, callback, speed=None, overflow_rate=0.5,
+                                           rng=_ScriptedRng([0.9, 0.1, 0.9, 0.9]))
+    stream.start()
+    assert done.wait(5.0)
+    stream.stop()
+    assert statuses[:3] == [False, True, False]
+    assert stream.overflows == 1
+
+
+def test_array_source_pads_with_silence_without_loop():
+    source = simulate.array_source(np.arange(1, 6, dtype=np.float32), loop=False)
+    np.testing.assert_array_equal(source(3), [1, 2, 3])
+    np.testing.assert_array_equal(source(3), [4, 5, 0])
+    np.testing.assert_array_equal(source(3), [0, 0, 0])
+
+
+def test_array_source_loops():
+    source = simulate.array_source(np.arange(1, 4, dtype=np.float32))
+    np.testing.assert_array_equal(source(5), [1, 2, 3, 1, 2])
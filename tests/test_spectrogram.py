@@ -0,0 +1,72 @@
+import queue
+
+import numpy as np
+
+from audio import buffer, process, spectrogram
+
+
+def _spectrogram(columns=4, window_length=16):
+    # fs == window_length gives 1 Hz bins; max_frequency keeps 3 of them
+    return spectrogram.Spectrogram(columns, fs=window_length, window_length=window_length, max_frequency=2,
+                                   floor_db=-60.0)
+
+
+def _column_db(level_db, bins=3):
+    return np.full(bins, 10 ** (level_db / 20.0))
+
+
+def test_read_orders_columns_oldest_first_after_wrap():
+    spec = _spectrogram(columns=4)
+    for level in (0, 10, 20, 30, 40, 50):
+        spec.push(_column_db(level))
+    sequence, image = spec.read()
+    assert sequence == 6
+    np.testing.assert_allclose(image[:, 0], [20, 30, 40, 50], atol=1e-4)
+
+
+def test_read_latest_returns_newest_column_across_wrap():
+    spec = _spectrogram(columns=3)
+    for level in (0, 10, 20, 30):
+        spec.push(_column_db(level))
+    sequence, column = spec.read_latest()
+    assert sequence == 4
+    np.testing.assert_allclose(column, 30, atol=1e-4)
+
+
+def test_push_clips_to_floor_and_missing_columns_are_floor():
+    spec = _spectrogram(columns=4)
+    spec.push(np.zeros(9))
+    spec.push_missing(2)
+    spec.push(_column_db(10))
+    sequence, image = spec.read()
+    assert sequence == 4
+    np.testing.assert_allclose(image[:, 0], [-60, -60, -60, 10], atol=1e-4)
+
+
+def test_rolling_buffer_read_sequence_until_overwritten():
+    rolling = buffer.RollingBuffer(3, chunk_size=2)
+    for value in range(1, 5):
+        rolling.write(np.full(2, value, np.float32))
+    assert rolling.read_sequence(1) is None  # overwritten by sequence 4
+    np.testing.assert_array_equal(rolling.read_sequence(2), [2, 2])
+    np.testing.assert_array_equal(rolling.read_sequence(4), [4, 4])
+    assert rolling.read_sequence(5) is None
+
+
+def test_processor_fills_skipped_hops_from_ring_and_floors_the_rest():
+    window_length = 16
+    rolling = buffer.RollingBuffer(3, chunk_size=window_length)
+    spec = spectrogram.Spectrogram(8, fs=window_length, window_length=window_length)
+    processor = process.Processor(rolling, queue.Queue(), window_length, window_length, spec)
+    tone = np.sin(2 * np.pi * 2 * np.arange(window_length) / window_length).astype(np.float32)
+    for _ in range(5):
+        rolling.write(tone)
+    sequence, data = rolling.read_latest()
+
+    processor._update_spectrogram(0, sequence, data)
+
+    total, image = spec.read()
+    assert total == 5
+    floor = np.all(image[-5:] == spec.floor_db, axis=1)
+    # Sequences 1 and 2 were overwritten, 3 and 4 are still in the ring, 5 is current
+    assert floor.tolist() == [True, True, False, False, False]